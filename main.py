@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 import sys
 import logging
-import json
+import os
+from typing import Set
 from pathlib import Path
 from datetime import datetime
 from PyQt6.QtWidgets import QApplication, QMessageBox, QSplashScreen
@@ -11,6 +12,31 @@ from src.core.config import AppConfig, get_config
 from src.ui.main_window import MainWindow
 from src.core.exceptions import ConfigError, FileError
 
+# Fixed contents for first-launch files, written as-is without serializing
+_TEMPLATE_JSON_BYTES = b'''{
+  "data": {
+    "name": "",
+    "description": "",
+    "personality": "",
+    "first_mes": "",
+    "mes_example": "",
+    "scenario": "",
+    "creator_notes": "",
+    "system_prompt": "",
+    "post_history_instructions": "",
+    "alternate_greetings": [],
+    "tags": []
+  },
+  "spec": "chara_card_v2",
+  "spec_version": "2.0"
+}'''
+
+_DEFAULT_CONFIG_YAML_BYTES = b'''API_URL: http://127.0.0.1:5000/v1/chat/completions
+API_KEY: ''
+generation:
+  max_tokens: 2048
+'''
+
 def setup_logging():
     """Configure application logging"""
     # Create logs directory
@@ -66,41 +92,31 @@ def check_dependencies() -> bool:
     
     return True
 
+def list_subdirectory_names(directory: Path) -> Set[str]:
+    """Return the names of subdirectories in a directory, empty if it is missing"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        return set()
+
 def check_directories() -> bool:
     """Check and create required directories"""
     try:
         data_dir = Path("data")
-        required_dirs = [
-            data_dir / "characters",
-            data_dir / "base_prompts",
-            data_dir / "config",
-            data_dir / "logs"
-        ]
+        required_dirs = ["characters", "base_prompts", "config", "logs"]
         
-        for directory in required_dirs:
-            directory.mkdir(parents=True, exist_ok=True)
+        # List the data directory once and only create what is missing
+        # (a regular file with a required name still makes mkdir raise)
+        existing = list_subdirectory_names(data_dir)
+        for name in required_dirs:
+            if name not in existing:
+                (data_dir / name).mkdir(parents=True, exist_ok=True)
             
         # Check for template.json
         template_path = data_dir / "config" / "template.json"
         if not template_path.exists():
-            with open(template_path, 'w') as f:
-                json.dump({
-                    "data": {
-                        "name": "",
-                        "description": "",
-                        "personality": "",
-                        "first_mes": "",
-                        "mes_example": "",
-                        "scenario": "",
-                        "creator_notes": "",
-                        "system_prompt": "",
-                        "post_history_instructions": "",
-                        "alternate_greetings": [],
-                        "tags": []
-                    },
-                    "spec": "chara_card_v2",
-                    "spec_version": "2.0"
-                }, f, indent=2)
+            template_path.write_bytes(_TEMPLATE_JSON_BYTES)
         return True
     except Exception as e:
         QMessageBox.critical(
@@ -117,17 +133,7 @@ def check_config() -> bool:
     if not config_path.exists():
         try:
             # Create default configuration
-            default_config = {
-                "API_URL": "http://127.0.0.1:5000/v1/chat/completions",
-                "API_KEY": "",
-                "generation": {
-                    "max_tokens": 2048,
-                }
-            }
-            
-            import yaml
-            with open(config_path, 'w') as f:
-                yaml.safe_dump(default_config, f, default_flow_style=False)
+            config_path.write_bytes(_DEFAULT_CONFIG_YAML_BYTES)
             
             QMessageBox.information(
                 None,
@@ -1,10 +1,19 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Any, Union, Callable
+from typing import Dict, List, Optional, Set, Any, Union, Callable, FrozenSet
 from datetime import datetime
+from itertools import groupby
+import re
 from PIL import Image
 from .exceptions import MismatchedTagError
 from .enums import FieldName, CardFormat, GenerationMode, PromptTagType
 
+_FIELD_TAG_PATTERN = re.compile(r'{{(\w+)}}')
+NON_FIELD_TAGS = frozenset(['input', 'if_input', '/if_input', 'char', 'user'])
+
+# Required fields per template text, shared by all templates with that text
+_REQUIRED_FIELDS_CACHE_SIZE = 256
+_required_fields_cache: Dict[str, FrozenSet[FieldName]] = {}
+
 @dataclass
 class CharacterData:
     """Container for character data and metadata"""
@@ -39,6 +48,12 @@ class CharacterData:
     def from_dict(cls, data: Dict[str, Any]) -> 'CharacterData':
         """Create instance from dictionary data"""
         card_data = data.get("data", {})
+        
+        # Only fall back to the current time for missing timestamps
+        now = datetime.now()
+        created_at = card_data.get("created_at")
+        modified_at = card_data.get("modified_at")
+        
         return cls(
             name=card_data.get("name", ""),
             fields={
@@ -50,8 +65,8 @@ class CharacterData:
             tags=card_data.get("tags", []),
             creator=card_data.get("creator", "Anonymous"),
             version=card_data.get("character_version", "main"),
-            created_at=datetime.fromisoformat(card_data.get("created_at", datetime.now().isoformat())),
-            modified_at=datetime.fromisoformat(card_data.get("modified_at", datetime.now().isoformat()))
+            created_at=datetime.fromisoformat(created_at) if created_at is not None else now,
+            modified_at=datetime.fromisoformat(modified_at) if modified_at is not None else now
         )
 
 @dataclass
@@ -80,15 +95,24 @@ class PromptTemplate:
     
     def _extract_required_fields(self) -> None:
         """Extract required fields from template text"""
-        import re
-        field_tags = re.findall(r'{{(\w+)}}', self.text)
+        required = _required_fields_cache.get(self.text)
         
-        for tag in field_tags:
-            try:
-                if tag not in ['input', 'if_input', '/if_input', 'char', 'user']:
-                    self.required_fields.add(FieldName(tag))
-            except ValueError:
-                pass
+        if required is None:
+            found = set()
+            for tag in _FIELD_TAG_PATTERN.findall(self.text):
+                try:
+                    if tag not in NON_FIELD_TAGS:
+                        found.add(FieldName(tag))
+                except ValueError:
+                    pass
+            required = frozenset(found)
+            
+            # Evict the oldest entry once the cache is full
+            if len(_required_fields_cache) >= _REQUIRED_FIELDS_CACHE_SIZE:
+                _required_fields_cache.pop(next(iter(_required_fields_cache)))
+            _required_fields_cache[self.text] = required
+        
+        self.required_fields.update(required)
 
 @dataclass
 class PromptSet:
@@ -107,15 +131,15 @@ class PromptSet:
             key=lambda x: x.generation_order
         )
         
-        # Check each template only requires fields that come before it
-        for template in ordered_templates:
-            available_fields = {
-                t.field for t in ordered_templates
-                if t.generation_order < template.generation_order
-            }
-            
-            if not template.required_fields.issubset(available_fields):
-                return False
+        # Check each template only requires fields that come before it,
+        # growing the available set one generation order at a time
+        available_fields = set()
+        for _, group in groupby(ordered_templates, key=lambda x: x.generation_order):
+            group = list(group)
+            for template in group:
+                if not template.required_fields.issubset(available_fields):
+                    return False
+            available_fields.update(t.field for t in group)
         
         return True
 
@@ -161,10 +161,11 @@ class CharacterService:
     
     def create_character(self, name: str) -> CharacterData:
         """Create a new character instance"""
+        now = datetime.now()
         return CharacterData(
             name=name,
-            created_at=datetime.now(),
-            modified_at=datetime.now()
+            created_at=now,
+            modified_at=now
         )
     
     def delete_character(self, identifier: str) -> None:
@@ -193,8 +194,10 @@ class CharacterService:
             
             if format == CardFormat.JSON:
                 file_path = file_path.with_suffix('.json')
-                with open(file_path, 'w') as f:
-                    json.dump(data.to_dict(), f, indent=2)
+                # Serialize once and write the encoded bytes in one call
+                json_bytes = json.dumps(data.to_dict(), indent=2).encode('utf-8')
+                with open(file_path, 'wb') as f:
+                    f.write(json_bytes)
             else:
                 file_path = file_path.with_suffix('.png')
                 png_data = self._create_png_card(data, data.image_data)
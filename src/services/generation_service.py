@@ -1,8 +1,9 @@
-from typing import Dict, Optional, Callable, List, Any
+from typing import Dict, Optional, Callable, List, Any, Tuple, Deque
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 
-from ..core.models import GenerationContext, GenerationResult, CharacterData
+from ..core.models import GenerationContext, GenerationResult, CharacterData, PromptSet
 from ..core.enums import FieldName, GenerationMode
 from ..core.exceptions import GenerationError, DependencyError
 from .api_service import ApiService
@@ -19,10 +20,15 @@ class GenerationCallbacks:
 class GenerationService:
     """Handles character field generation logic"""
     
-    def __init__(self, api_service: ApiService, prompt_service: PromptService):
+    def __init__(self, api_service: ApiService, prompt_service: PromptService,
+                 max_history: int = 100):
         self.api_service = api_service
         self.prompt_service = prompt_service
-        self.generation_history: Dict[FieldName, List[GenerationResult]] = {}
+        self.max_history = max_history
+        # Oldest results are dropped once a field has max_history entries
+        self.generation_history: Dict[FieldName, Deque[GenerationResult]] = {}
+        # (prompt set, ordered fields, field -> position) for the last set seen
+        self._order_cache: Optional[Tuple[PromptSet, Tuple[FieldName, ...], Dict[FieldName, int]]] = None
     
     def generate_field(self, context: GenerationContext) -> GenerationResult:
         """Generate content for a single field"""
@@ -83,14 +89,13 @@ class GenerationService:
         results = {}
         
         # Get the ordered list of fields (only those with orders)
-        ordered_fields = self._get_ordered_fields()
+        ordered_fields, positions = self._get_field_order()
         if not ordered_fields:
             raise GenerationError("No fields with generation order defined")
         
         # Find starting index
-        try:
-            start_idx = ordered_fields.index(context.current_field)
-        except ValueError:
+        start_idx = positions.get(context.current_field)
+        if start_idx is None:
             raise GenerationError(f"Field {context.current_field.value} not found in generation order")
         
         # Generate each field in order starting from the requested field
@@ -203,22 +208,35 @@ class GenerationService:
     
     def _get_ordered_fields(self) -> List[FieldName]:
         """Get fields with order, sorted by order number"""
-        ordered_fields = [
-            (field, template.generation_order)
-            for field, template in self.prompt_service.current_set.templates.items()
-            if hasattr(template, 'generation_order') and template.generation_order >= 0
-        ]
-        return [field for field, _ in sorted(ordered_fields, key=lambda x: x[1])]
+        # Hand out a fresh list so callers cannot alter the cached order
+        return list(self._get_field_order()[0])
+    
+    def _get_field_order(self) -> Tuple[Tuple[FieldName, ...], Dict[FieldName, int]]:
+        """Get ordered fields and their positions, cached per loaded prompt set"""
+        prompt_set = self.prompt_service.current_set
+        
+        if self._order_cache is None or self._order_cache[0] is not prompt_set:
+            ordered_fields = [
+                (field, template.generation_order)
+                for field, template in prompt_set.templates.items()
+                if template.generation_order >= 0
+            ]
+            ordered_fields = tuple(field for field, _ in sorted(ordered_fields, key=lambda x: x[1]))
+            positions = {field: idx for idx, field in enumerate(ordered_fields)}
+            self._order_cache = (prompt_set, ordered_fields, positions)
+        
+        return self._order_cache[1], self._order_cache[2]
     
     def _add_to_history(self, result: GenerationResult) -> None:
         """Add generation result to history"""
-        if result.field not in self.generation_history:
-            self.generation_history[result.field] = []
-        self.generation_history[result.field].append(result)
+        history = self.generation_history.get(result.field)
+        if history is None:
+            history = self.generation_history[result.field] = deque(maxlen=self.max_history)
+        history.append(result)
     
     def get_field_history(self, field: FieldName) -> List[GenerationResult]:
-        """Get generation history for a field"""
-        return self.generation_history.get(field, [])
+        """Get generation history for a field, oldest first"""
+        return list(self.generation_history.get(field, ()))
     
     def clear_history(self, field: Optional[FieldName] = None) -> None:
         """Clear generation history for a field or all fields"""
@@ -12,6 +12,9 @@ from ..core.exceptions import (
 )
 from ..core.config import PathConfig
 
+_CONDITIONAL_PATTERN = re.compile(r'{{if_input}}(.*?){{/if_input}}', re.DOTALL)
+_FIELD_TAGS = {field: f'{{{{{field.value}}}}}' for field in FieldName}
+
 class PromptService:
     """Manages prompt templates and processing"""
     
@@ -45,12 +48,17 @@ class PromptService:
                 except ValueError:
                     continue  # Skip invalid field names
             
+            # Only fall back to the current time for missing timestamps
+            now = datetime.now()
+            created_at = data.get('created_at')
+            modified_at = data.get('modified_at')
+            
             prompt_set = PromptSet(
                 name=name,
                 templates=templates,
                 description=data.get('description', ''),
-                created_at=datetime.fromisoformat(data.get('created_at', datetime.now().isoformat())),
-                modified_at=datetime.fromisoformat(data.get('modified_at', datetime.now().isoformat()))
+                created_at=datetime.fromisoformat(created_at) if created_at is not None else now,
+                modified_at=datetime.fromisoformat(modified_at) if modified_at is not None else now
             )
             
             self._current_set = prompt_set
@@ -104,28 +112,23 @@ class PromptService:
         """Process a prompt template with given context"""
         result = template.text
         
+        # Templates without any tags need no substitution
+        if '{{' not in result:
+            return result.strip()
+        
         # Handle conditional sections
-        if input_text.strip():
-            result = re.sub(
-                r'{{if_input}}(.*?){{/if_input}}',
-                r'\1',
-                result,
-                flags=re.DOTALL
-            )
-        else:
-            result = re.sub(
-                r'{{if_input}}.*?{{/if_input}}',
-                '',
-                result,
-                flags=re.DOTALL
-            )
+        result = _CONDITIONAL_PATTERN.sub(
+            r'\1' if input_text.strip() else '',
+            result
+        )
         
         # Replace input placeholder
         result = result.replace('{{input}}', input_text)
         
         # Replace field references
+        field_tags = _FIELD_TAGS
         for field, value in context.items():
-            result = result.replace(f'{{{{{field.value}}}}}', value)
+            result = result.replace(field_tags[field], value)
         
         return result.strip()
     
@@ -136,12 +139,13 @@ class PromptService:
     
     def create_prompt_set(self, name: str, description: str = "") -> PromptSet:
         """Create a new prompt set"""
+        now = datetime.now()
         return PromptSet(
             name=name,
             templates={},
             description=description,
-            created_at=datetime.now(),
-            modified_at=datetime.now()
+            created_at=now,
+            modified_at=now
         )
     
     def get_generation_order(self) -> List[FieldName]:
@@ -525,7 +525,7 @@ class GenerationTab(QWidget):
     
     def _handle_greeting_deleted(self, index: int):
         """Handle deletion of an alternate greeting"""
-        if self.current_character and hasattr(self.current_character, 'alternate_greetings'):
+        if self.current_character:
             if 0 <= index < len(self.current_character.alternate_greetings):
                 self.current_character.alternate_greetings.pop(index)
                 self.status_bar.set_status("Deleted alternate greeting")
@@ -536,10 +536,6 @@ class GenerationTab(QWidget):
             if not self.current_character:
                 raise GenerationError("No character loaded")
             
-            # Initialize alternate_greetings if it doesn't exist
-            if not hasattr(self.current_character, 'alternate_greetings'):
-                self.current_character.alternate_greetings = []
-            
             # Check if the index is valid in the widget's greetings list
             if not self.alt_greetings_widget.greetings or \
             index >= len(self.alt_greetings_widget.greetings):
@@ -604,8 +600,10 @@ class GenerationTab(QWidget):
     def _update_output_displays(self, fields: Dict[FieldName, str]):
         """Update all output displays with new values"""
         for field, value in fields.items():
-            if field in self.output_texts:
-                self.output_texts[field].setPlainText(value)
+            text_edit = self.output_texts.get(field)
+            # Skip unchanged fields to avoid a relayout and change signals
+            if text_edit is not None and text_edit.toPlainText() != value:
+                text_edit.setPlainText(value)
     
     def _create_generation_context(self, field: FieldName) -> GenerationContext:
         """Create generation context for a field"""
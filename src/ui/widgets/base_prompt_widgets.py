@@ -1,4 +1,5 @@
 from typing import Dict, Optional, List
+import re
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit,
     QLabel, QLineEdit, QSpinBox, QFrame,
@@ -8,8 +9,12 @@ from PyQt6.QtCore import pyqtSignal
 
 from ...core.enums import FieldName
 from ...core.exceptions import TagError, MismatchedTagError
+from ...core.models import NON_FIELD_TAGS
 from ..widgets.common import EditableField, LoadSaveWidget
 
+_TAG_PATTERN = re.compile(r'{{(/?\w+)}}')
+_FIELD_VALUES = frozenset(field.value for field in FieldName)
+
 class BasePromptWidget(QWidget):
     """Widget for editing a single base prompt"""
     prompt_changed = pyqtSignal(FieldName, str)  # Prompt text changed
@@ -231,16 +236,29 @@ class BasePromptsContainer(QWidget):
     
     def _validate_prompts(self, prompts: Dict[FieldName, str]) -> bool:
         """Validate prompt tags"""
-        import re
-        
         for field, prompt in prompts.items():
             if not prompt.strip():
                 continue
-                
-            # Check for balanced conditional tags
-            open_tags = len(re.findall(r'{{if_input}}', prompt))
-            close_tags = len(re.findall(r'{{/if_input}}', prompt))
             
+            # Single pass over all tags: count conditionals and
+            # remember the first invalid field reference
+            open_tags = close_tags = 0
+            invalid_ref = None
+            for match in _TAG_PATTERN.finditer(prompt):
+                tag = match.group(1)
+                if tag == 'if_input':
+                    open_tags += 1
+                elif tag == '/if_input':
+                    close_tags += 1
+                elif tag.startswith('/'):
+                    # Other closing-style tags are never field references
+                    continue
+                elif (invalid_ref is None and
+                      tag not in NON_FIELD_TAGS and
+                      tag not in _FIELD_VALUES):
+                    invalid_ref = tag
+            
+            # Check for balanced conditional tags
             if open_tags != close_tags:
                 raise TagError(
                     f"Mismatched conditional tags in {field.value}: "
@@ -248,15 +266,10 @@ class BasePromptsContainer(QWidget):
                 )
             
             # Validate field references
-            field_refs = re.findall(r'{{(\w+)}}', prompt)
-            for ref in field_refs:
-                if ref not in ['input', 'if_input', '/if_input', 'char', 'user']:
-                    try:
-                        FieldName(ref)
-                    except ValueError:
-                        raise TagError(
-                            f"Invalid field reference in {field.value}: {ref}"
-                        )
+            if invalid_ref is not None:
+                raise TagError(
+                    f"Invalid field reference in {field.value}: {invalid_ref}"
+                )
         
         return True
     
@@ -278,14 +291,16 @@ class BasePromptsContainer(QWidget):
     def set_prompts(self, prompts: Dict[FieldName, str]):
         """Set all prompt texts"""
         for field, text in prompts.items():
-            if field in self.prompt_widgets:
-                self.prompt_widgets[field].set_prompt(text)
+            widget = self.prompt_widgets.get(field)
+            if widget is not None:
+                widget.set_prompt(text)
     
     def set_orders(self, orders: Dict[FieldName, int]):
         """Set all generation orders"""
         for field, order in orders.items():
-            if field in self.prompt_widgets:
-                self.prompt_widgets[field].set_order(order)
+            widget = self.prompt_widgets.get(field)
+            if widget is not None:
+                widget.set_order(order)
     
     def update_available_sets(self, sets: List[str]):
         """Update list of available prompt sets"""
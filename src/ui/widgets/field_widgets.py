@@ -424,12 +424,16 @@ class ExpandedFieldView(QWidget):
 
     def update_input(self, text: str):
         """Update input text without triggering signals"""
+        if self.input_edit.toPlainText() == text:
+            return
         self.input_edit.blockSignals(True)
         self.input_edit.setPlainText(text)
         self.input_edit.blockSignals(False)
     
     def update_output(self, text: str):
         """Update output text without triggering signals"""
+        if self.output_edit.toPlainText() == text:
+            return
         self.output_edit.blockSignals(True)
         self.output_edit.setPlainText(text)
         self.output_edit.blockSignals(False)
@@ -454,9 +458,10 @@ class FieldViewManager:
                           regen_callback=None,
                           regen_deps_callback=None) -> None:
         """Toggle expanded view for a field"""
-        if field in self.active_views and self.active_views[field].isVisible():
-            self.active_views[field].close()
-            self.active_views.pop(field)
+        active_view = self.active_views.get(field)
+        if active_view is not None and active_view.isVisible():
+            active_view.close()
+            self.active_views.pop(field, None)
         else:
             # Create view without parent
             view = ExpandedFieldView(field, input_text, output_text)
@@ -486,8 +491,7 @@ class FieldViewManager:
 
     def handle_view_closed(self, field: FieldName):
         """Handle view closure from window system"""
-        if field in self.active_views:
-            self.active_views.pop(field)
+        self.active_views.pop(field, None)
     
     def close_all(self):
         """Close all expanded views"""
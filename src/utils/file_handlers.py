@@ -1,6 +1,8 @@
 from typing import Dict, Any, Optional, List
 from pathlib import Path
+from operator import itemgetter
 import json
+import os
 import yaml
 import shutil
 from datetime import datetime
@@ -98,13 +100,19 @@ class BackupManager:
             raise FileError(f"Error restoring backup: {str(e)}")
     
     def list_backups(self, file_stem: str) -> List[Path]:
-        """List available backups for a file"""
+        """List available backups for a file, newest first"""
+        prefix = f"{file_stem}_"
         try:
-            return sorted(
-                [f for f in self.backup_dir.glob(f"{file_stem}_*")],
-                key=lambda x: x.stat().st_mtime,
-                reverse=True
-            )
+            with os.scandir(self.backup_dir) as entries:
+                candidates = [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in entries
+                    if entry.name.startswith(prefix)
+                ]
+            
+            candidates.sort(key=itemgetter(0), reverse=True)
+            
+            return [Path(path) for _, path in candidates]
         except Exception as e:
             raise FileError(f"Error listing backups: {str(e)}")
     
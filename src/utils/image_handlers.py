@@ -2,6 +2,7 @@ from typing import Optional, Tuple, Dict, Any
 from pathlib import Path
 import base64
 import json
+import os
 from io import BytesIO
 from PIL import Image
 from PIL.PngImagePlugin import PngInfo
@@ -168,13 +169,21 @@ class ImageCache:
     
     def _cleanup_cache(self) -> None:
         """Clean up old cache entries"""
-        cache_files = sorted(
-            self.cache_dir.glob('*.png'),
-            key=lambda x: x.stat().st_mtime
-        )
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                cache_files = sorted(
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in entries
+                    if entry.name.endswith('.png')
+                )
+        except FileNotFoundError:
+            # Cache directory was removed, so there is nothing to evict
+            return
         
-        while len(cache_files) >= self.max_size:
+        # Remove the oldest entries until there is room for one more
+        excess = len(cache_files) - self.max_size + 1
+        for _, path in cache_files[:max(excess, 0)]:
             try:
-                cache_files.pop(0).unlink()
+                os.unlink(path)
             except Exception:
                 continue